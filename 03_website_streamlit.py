@@ -12,13 +12,43 @@ Updated: Februari 2025
 # ============================================================================
 
 import streamlit as st
-import tensorflow as tf
 import numpy as np
+import pandas as pd
 from PIL import Image
 import json
 import os
 from pathlib import Path
 import io
+import threading
+import queue
+from concurrent.futures import Future
+import functools
+import base64
+import html
+import re
+import types
+
+# OpenCV opsional: resize lebih cepat (SIMD). Kalau tidak terpasang,
+# preprocessing memakai resize PIL
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# orjson opsional: parser JSON lebih cepat, fallback ke json bawaan
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Threading TensorFlow di CPU - harus di-set sebelum TensorFlow di-import.
+# Untuk inferensi batch kecil, 2 thread intra-op / 1 inter-op lebih stabil
+# di vCPU bersama (Streamlit Cloud) daripada default yang memakai semua core.
+# setdefault: nilai dari environment deployment tetap diutamakan
+os.environ.setdefault('OMP_NUM_THREADS', '2')
+os.environ.setdefault('TF_NUM_INTEROP_THREADS', '1')
+os.environ.setdefault('TF_NUM_INTRAOP_THREADS', '2')
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
 
 # Set page config (HARUS di paling awal)
 st.set_page_config(
@@ -33,127 +63,469 @@ st.set_page_config(
 # ============================================================================
 
 # Path ke model dan file pendukung
-# Coba .h5 dulu, kalau tidak ada coba .keras
+# Urutan prioritas: .tflite (INT8) -> .tflite (FP16) -> .h5 -> .keras
+# File .tflite dibuat dengan script 04_convert_tflite.py
+MODEL_PATH_TFLITE = 'final_model_int8.tflite'
+MODEL_PATH_TFLITE_FP16 = 'final_model_fp16.tflite'
 MODEL_PATH_H5 = 'final_model.h5'
 MODEL_PATH_KERAS = 'final_model.keras'
 CLASS_INDICES_PATH = 'class_indices.json'
 
+# Default mapping jika class_indices.json tidak ada / rusak
+DEFAULT_CLASS_MAPPING = {
+    'tari_bedhaya': 'Tari Bedhaya',
+    'tari_dolalak': 'Tari Dolalak',
+    'tari_gambyong': 'Tari Gambyong',
+    'tari_golek': 'Tari Golek',
+    'tari_srimpi': 'Tari Srimpi'
+}
+
 # Ukuran gambar input model
 IMG_SIZE = 224
 
+# Jumlah thread CPU untuk TFLite interpreter (sama dengan intra-op TF).
+# Nilai kosong / bukan angka dari environment -> 2; 0 (konvensi TF =
+# otomatis) atau negatif -> jumlah core
+try:
+    TFLITE_NUM_THREADS = int(os.environ['TF_NUM_INTRAOP_THREADS'])
+except ValueError:
+    TFLITE_NUM_THREADS = 2
+if TFLITE_NUM_THREADS < 1:
+    TFLITE_NUM_THREADS = max(1, os.cpu_count() or 1)
+
+# Micro-batching: maksimum gambar per forward pass & batas tunggu hasil (detik)
+BATCH_MAX_SIZE = 8
+PREDICT_TIMEOUT = 30
+
+# Jumlah hasil inferensi (per tensor input) yang disimpan di LRU cache
+INFER_CACHE_SIZE = 32
+
+# Ukuran maksimum gambar upload yang ditampilkan (px)
+DISPLAY_MAX_SIZE = 800
+
+# Folder gambar ilustrasi tarian (opsional). Kalau file belum ada,
+# ditampilkan placeholder SVG yang dibuat lokal (tanpa request HTTP)
+IMAGES_DIR = 'images'
+
+# Metode resize input model. Dipilih BILINEAR (lebih cepat dari default PIL,
+# BICUBIC sejak Pillow 7.0). Filter ini TIDAK identik dengan loader training
+# (pipeline training tidak ada di repo ini; bilinear tf.image.resize tanpa
+# antialias, bilinear PIL dengan antialias saat downscale) dan belum dicek
+# akurasinya terhadap BICUBIC. Kalau OpenCV ada: INTER_AREA untuk downscale
+# (bukan bilinear juga), INTER_LINEAR kalau gambar lebih kecil dari IMG_SIZE
+# (upscale INTER_AREA mendekati nearest-neighbour).
+# Harus sama dengan 04_convert_tflite.py
+_RESAMPLE = Image.Resampling.BILINEAR
+
+# Lookup table normalisasi uint8 -> float32 (0-1), cukup 256 entri
+_NORM_LUT = np.arange(256, dtype=np.float32) / np.float32(255.0)
+
 # Informasi detail setiap tarian
-TARI_INFO = {
-    'Tari Bedhaya': {
-        'deskripsi': '''
-        Tari Bedhaya adalah tarian sakral dan tertua yang mencerminkan kerumitan 
-        budaya keraton Surakarta dan Yogyakarta. Tarian ini memiliki nilai-nilai 
-        edukatif religius, sakral, dan etika kesantunan wanita keraton.
-        ''',
-        'karakteristik': [
-            'Ditarikan oleh 7-9 penari wanita',
-            'Gerakan lemah lembut dan khidmat',
-            'Kostum didominasi warna hijau atau biru',
-            'Menggunakan kain batik motif parang atau kawung',
-            'Aksesoris kepala: mahkota atau jamang'
-        ],
-        'asal': 'Keraton Surakarta & Yogyakarta',
-        'image': 'https://via.placeholder.com/400x300?text=Tari+Bedhaya'
-    },
-    
-    'Tari Srimpi': {
-        'deskripsi': '''
-        Tari Srimpi merupakan tarian putri yang berkarakter lungguh (halus) dan 
-        ditarikan secara berkelompok. Sering digunakan untuk menyambut tamu 
-        kehormatan di keraton.
-        ''',
-        'karakteristik': [
-            'Ditarikan oleh 4 penari wanita',
-            'Gerakan anggun dan simetris',
-            'Kostum warna-warni cerah (merah, kuning, hijau, biru)',
-            'Masing-masing penari mewakili arah mata angin',
-            'Menggunakan sampur (selendang)'
-        ],
-        'asal': 'Keraton Jawa Tengah',
-        'image': 'https://via.placeholder.com/400x300?text=Tari+Srimpi'
-    },
-    
-    'Tari Gambyong': {
-        'deskripsi': '''
-        Tari Gambyong awalnya tari tunggal putri, tetapi kini sering ditarikan 
-        berkelompok untuk pembukaan acara, penyambutan tamu, atau pertunjukan 
-        komersial. Berasal dari tarian rakyat (tledhek).
-        ''',
-        'karakteristik': [
-            'Gerakan dinamis dan energik',
-            'Kostum didominasi warna cerah (merah, kuning, emas)',
-            'Menggunakan sanggul besar dengan bunga melati',
-            'Aksesoris berupa kalung, gelang, dan subang',
-            'Ekspresi wajah ceria dan sumringah'
-        ],
-        'asal': 'Surakarta, Jawa Tengah',
-        'image': 'https://via.placeholder.com/400x300?text=Tari+Gambyong'
-    },
-    
-    'Tari Golek': {
-        'deskripsi': '''
-        Tari Golek merupakan tarian klasik yang sangat populer, merepresentasikan 
-        remaja putri yang sedang dalam masa pencarian jati diri melalui upaya 
-        berhias diri.
-        ''',
-        'karakteristik': [
-            'Tari tunggal atau berpasangan',
-            'Gerakan luwes dan gemulai',
-            'Kostum didominasi warna pastel (pink, ungu, hijau muda)',
-            'Menggunakan kain batik halus',
-            'Properti: kipas atau sampur'
-        ],
-        'asal': 'Surakarta, Jawa Tengah',
-        'image': 'https://via.placeholder.com/400x300?text=Tari+Golek'
-    },
-    
-    'Tari Dolalak': {
-        'deskripsi': '''
-        Tari Dolalak merupakan warisan budaya dari zaman penjajahan Belanda, 
-        hasil akulturasi budaya Barat dan Jawa. Tarian ini meniru gerak-gerik 
-        serdadu Belanda dengan iringan musik tradisional.
-        ''',
-        'karakteristik': [
-            'Ditarikan oleh kelompok (biasanya wanita)',
-            'Gerakan menyerupai marcheren tentara',
-            'Kostum unik: perpaduan kebaya dan atribut militer',
-            'Menggunakan topi (omprok) khas',
-            'Gerakan rampak dan dinamis'
-        ],
-        'asal': 'Purworejo, Jawa Tengah',
-        'image': 'https://via.placeholder.com/400x300?text=Tari+Dolalak'
-    }
-}
+@st.cache_resource
+def get_tari_info():
+    """Informasi detail setiap tarian (dibuat sekali per proses, read-only)"""
+    return types.MappingProxyType({
+        'Tari Bedhaya': {
+            'deskripsi': '''
+            Tari Bedhaya adalah tarian sakral dan tertua yang mencerminkan kerumitan 
+            budaya keraton Surakarta dan Yogyakarta. Tarian ini memiliki nilai-nilai 
+            edukatif religius, sakral, dan etika kesantunan wanita keraton.
+            ''',
+            'karakteristik': [
+                'Ditarikan oleh 7-9 penari wanita',
+                'Gerakan lemah lembut dan khidmat',
+                'Kostum didominasi warna hijau atau biru',
+                'Menggunakan kain batik motif parang atau kawung',
+                'Aksesoris kepala: mahkota atau jamang'
+            ],
+            'asal': 'Keraton Surakarta & Yogyakarta',
+            'image': os.path.join(IMAGES_DIR, 'tari_bedhaya.jpg')
+        },
+    
+        'Tari Srimpi': {
+            'deskripsi': '''
+            Tari Srimpi merupakan tarian putri yang berkarakter lungguh (halus) dan 
+            ditarikan secara berkelompok. Sering digunakan untuk menyambut tamu 
+            kehormatan di keraton.
+            ''',
+            'karakteristik': [
+                'Ditarikan oleh 4 penari wanita',
+                'Gerakan anggun dan simetris',
+                'Kostum warna-warni cerah (merah, kuning, hijau, biru)',
+                'Masing-masing penari mewakili arah mata angin',
+                'Menggunakan sampur (selendang)'
+            ],
+            'asal': 'Keraton Jawa Tengah',
+            'image': os.path.join(IMAGES_DIR, 'tari_srimpi.jpg')
+        },
+    
+        'Tari Gambyong': {
+            'deskripsi': '''
+            Tari Gambyong awalnya tari tunggal putri, tetapi kini sering ditarikan 
+            berkelompok untuk pembukaan acara, penyambutan tamu, atau pertunjukan 
+            komersial. Berasal dari tarian rakyat (tledhek).
+            ''',
+            'karakteristik': [
+                'Gerakan dinamis dan energik',
+                'Kostum didominasi warna cerah (merah, kuning, emas)',
+                'Menggunakan sanggul besar dengan bunga melati',
+                'Aksesoris berupa kalung, gelang, dan subang',
+                'Ekspresi wajah ceria dan sumringah'
+            ],
+            'asal': 'Surakarta, Jawa Tengah',
+            'image': os.path.join(IMAGES_DIR, 'tari_gambyong.jpg')
+        },
+    
+        'Tari Golek': {
+            'deskripsi': '''
+            Tari Golek merupakan tarian klasik yang sangat populer, merepresentasikan 
+            remaja putri yang sedang dalam masa pencarian jati diri melalui upaya 
+            berhias diri.
+            ''',
+            'karakteristik': [
+                'Tari tunggal atau berpasangan',
+                'Gerakan luwes dan gemulai',
+                'Kostum didominasi warna pastel (pink, ungu, hijau muda)',
+                'Menggunakan kain batik halus',
+                'Properti: kipas atau sampur'
+            ],
+            'asal': 'Surakarta, Jawa Tengah',
+            'image': os.path.join(IMAGES_DIR, 'tari_golek.jpg')
+        },
+    
+        'Tari Dolalak': {
+            'deskripsi': '''
+            Tari Dolalak merupakan warisan budaya dari zaman penjajahan Belanda, 
+            hasil akulturasi budaya Barat dan Jawa. Tarian ini meniru gerak-gerik 
+            serdadu Belanda dengan iringan musik tradisional.
+            ''',
+            'karakteristik': [
+                'Ditarikan oleh kelompok (biasanya wanita)',
+                'Gerakan menyerupai marcheren tentara',
+                'Kostum unik: perpaduan kebaya dan atribut militer',
+                'Menggunakan topi (omprok) khas',
+                'Gerakan rampak dan dinamis'
+            ],
+            'asal': 'Purworejo, Jawa Tengah',
+            'image': os.path.join(IMAGES_DIR, 'tari_dolalak.jpg')
+        }
+    })
 
 # ============================================================================
 # LOAD MODEL & UTILITIES
 # ============================================================================
 
+class TFLiteModel:
+    """Wrapper tipis untuk tf.lite.Interpreter (model hasil quantization)"""
+    
+    # Dicek lewat atribut, bukan isinstance: Streamlit mengeksekusi ulang
+    # script setiap rerun sehingga class ini dibuat ulang, sedangkan objek
+    # model dari cache_resource masih instance class yang lama
+    is_tflite = True
+    
+    def __init__(self, model_path):
+        self.model_path = model_path
+        # Satu interpreter per ukuran batch (1, 2, 4, 8), bukan satu
+        # interpreter yang di-resize: resize + allocate_tensors ulang setiap
+        # ukuran batch berganti (1 -> N -> 1 ...) mahal
+        self._interpreters = {}
+        interpreter = self._get_interpreter(1)
+        self.input_details = interpreter.get_input_details()
+        self.output_details = interpreter.get_output_details()
+        # Interpreter tidak thread-safe, sedangkan cache_resource dipakai
+        # bersama oleh semua session
+        self._lock = threading.Lock()
+    
+    def _get_interpreter(self, batch_size):
+        """Interpreter dengan input batch_size (dibuat saat pertama dipakai)"""
+        interpreter = self._interpreters.get(batch_size)
+        if interpreter is None:
+            import tensorflow as tf
+            
+            interpreter = tf.lite.Interpreter(
+                model_path=self.model_path, num_threads=TFLITE_NUM_THREADS
+            )
+            input_detail = interpreter.get_input_details()[0]
+            if input_detail['shape'][0] != batch_size:
+                interpreter.resize_tensor_input(
+                    input_detail['index'], [batch_size, IMG_SIZE, IMG_SIZE, 3]
+                )
+            interpreter.allocate_tensors()
+            self._interpreters[batch_size] = interpreter
+        return interpreter
+    
+    def predict(self, batch):
+        """Jalankan inferensi, input/output float32 seperti model Keras"""
+        input_detail = self.input_details[0]
+        output_detail = self.output_details[0]
+        
+        # Pad batch gabungan ke pangkat dua terdekat (maks. BATCH_MAX_SIZE)
+        # supaya jumlah interpreter tetap kecil; baris padding dibuang lagi
+        num_images = len(batch)
+        batch_size = 1 << (num_images - 1).bit_length()
+        if batch_size != num_images:
+            padded = np.zeros((batch_size,) + batch.shape[1:], dtype=np.float32)
+            padded[:num_images] = batch
+            batch = padded
+        
+        # Quantize input (float 0-1) ke dtype integer model (uint8 / int8),
+        # di-clip supaya tidak overflow saat cast. Satu buffer float32 yang
+        # diproses in-place, bukan array baru di setiap langkah
+        if input_detail['dtype'] != np.float32:
+            scale, zero_point = input_detail['quantization']
+            dtype_info = np.iinfo(input_detail['dtype'])
+            quantized = np.divide(batch, np.float32(scale), dtype=np.float32)
+            quantized += np.float32(zero_point)
+            np.round(quantized, out=quantized)
+            np.clip(quantized, dtype_info.min, dtype_info.max, out=quantized)
+            batch = quantized.astype(input_detail['dtype'])
+        
+        with self._lock:
+            interpreter = self._get_interpreter(batch_size)
+            interpreter.set_tensor(input_detail['index'], batch)
+            interpreter.invoke()
+            predictions = interpreter.get_tensor(output_detail['index'])[:num_images]
+        
+        # Dequantize output kembali ke probabilitas float
+        if output_detail['dtype'] != np.float32:
+            scale, zero_point = output_detail['quantization']
+            predictions = (predictions.astype(np.float32) - zero_point) * scale
+        
+        return predictions
+
+def configure_inference_device():
+    """Pilih device inferensi: GPU kalau tersedia, kalau tidak CPU"""
+    import tensorflow as tf
+    
+    gpus = tf.config.list_physical_devices('GPU')
+    if not gpus:
+        return '/CPU:0'
+    
+    try:
+        # Jangan ambil seluruh VRAM, GPU bisa dipakai bersama worker lain
+        for gpu in gpus:
+            tf.config.experimental.set_memory_growth(gpu, True)
+    except RuntimeError:
+        # GPU sudah terinisialisasi, setting memory growth tidak bisa diubah
+        pass
+    return '/GPU:0'
+
+def make_forward_fn(model, device):
+    """Buat fungsi forward pass (numpy -> numpy) untuk model Keras maupun TFLite"""
+    if getattr(model, 'is_tflite', False):
+        return model.predict
+    
+    import tensorflow as tf
+    
+    def build(jit_compile):
+        # Panggil model langsung di dalam tf.function, bukan model.predict():
+        # predict() menyiapkan data adapter & callback setiap panggilan.
+        # input_signature (batch dinamis) mencegah retracing antar request
+        # (XLA tetap compile executable baru per ukuran batch, lihat bawah).
+        # tf.function sudah menjalankan model sebagai graph; jangan pakai
+        # disable_eager_execution() - Keras 3 (TF 2.16+) tidak mendukung mode TF1
+        @tf.function(jit_compile=jit_compile, input_signature=[
+            tf.TensorSpec([None, IMG_SIZE, IMG_SIZE, 3], tf.float32)
+        ])
+        def forward(batch):
+            return model(batch, training=False)
+        return forward
+    
+    # XLA menggabungkan depthwise conv + BN + ReLU6 MobileNetV2 jadi satu
+    # kernel, tapi meng-compile ulang (beberapa detik di CPU) untuk setiap
+    # ukuran batch baru - compile itu akan memblok worker BatchPredictor.
+    # Jadi XLA hanya untuk batch 1 (request tunggal, kasus paling umum);
+    # batch gabungan lewat graph biasa yang tidak perlu compile per ukuran.
+    # Kalau XLA gagal (tidak tersedia, error compile/runtime apa pun) pakai
+    # graph biasa - optimasi yang gagal tidak boleh mematikan klasifikasi
+    with tf.device(device):
+        graph_forward = build(jit_compile=False)
+        graph_forward(tf.zeros((2, IMG_SIZE, IMG_SIZE, 3), dtype=tf.float32))
+        try:
+            single_forward = build(jit_compile=True)
+            single_forward(tf.zeros((1, IMG_SIZE, IMG_SIZE, 3), dtype=tf.float32))
+        except tf.errors.OpError:
+            single_forward = graph_forward
+    
+    def run(batch):
+        forward = single_forward if len(batch) == 1 else graph_forward
+        with tf.device(device):
+            return forward(tf.convert_to_tensor(batch, dtype=tf.float32)).numpy()
+    
+    return run
+
+class BatchPredictor:
+    """Gabungkan request prediksi yang datang bersamaan jadi satu batch
+    
+    Satu thread worker menjalankan forward pass. Request yang masuk selama model
+    sedang menghitung batch sebelumnya akan dikumpulkan dan dijalankan
+    sekaligus pada forward pass berikutnya, sehingga user tunggal tidak
+    menunggu tambahan waktu sama sekali.
+    """
+    
+    def __init__(self, forward, max_batch_size=BATCH_MAX_SIZE):
+        self.forward = forward
+        self.max_batch_size = max_batch_size
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+    
+    def predict(self, batch, timeout=PREDICT_TIMEOUT):
+        """Kirim batch ke worker dan tunggu hasilnya"""
+        future = Future()
+        self._queue.put((batch, future))
+        return future.result(timeout=timeout)
+    
+    def _worker(self):
+        while True:
+            # Blok sampai ada request, lalu ambil semua yang sudah mengantri
+            requests = [self._queue.get()]
+            while len(requests) < self.max_batch_size:
+                try:
+                    requests.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Request tunggal (kasus paling umum) langsung diteruskan tanpa
+            # np.concatenate, hemat satu copy tensor di host
+            if len(requests) == 1:
+                batch = requests[0][0]
+            else:
+                batch = np.concatenate([batch for batch, _ in requests])
+            
+            try:
+                predictions = self.forward(batch)
+            except Exception as e:
+                for _, future in requests:
+                    future.set_exception(e)
+                continue
+            
+            # Bagi hasil kembali ke masing-masing request
+            offset = 0
+            for batch, future in requests:
+                future.set_result(predictions[offset:offset + len(batch)])
+                offset += len(batch)
+
+@st.cache_resource
+def get_batch_predictor():
+    """Satu BatchPredictor untuk semua session, memakai model dari ModelLoader"""
+    return BatchPredictor(get_model_loader().forward)
+
+@st.cache_resource
+def get_cached_infer():
+    """Inferensi dengan LRU cache berdasarkan bytes tensor hasil preprocess
+    
+    lru_cache dibuat di dalam cache_resource karena fungsi level modul
+    didefinisikan ulang setiap rerun Streamlit (cache-nya ikut hilang).
+    """
+    predictor = get_batch_predictor()
+    
+    @functools.lru_cache(maxsize=INFER_CACHE_SIZE)
+    def infer(tensor_bytes):
+        batch = np.frombuffer(tensor_bytes, dtype=np.float32).reshape(1, IMG_SIZE, IMG_SIZE, 3)
+        return tuple(predictor.predict(batch)[0].tolist())
+    
+    return infer
+
+@st.cache_resource
+def detect_model_format():
+    """Format model yang akan dipakai load_model (tanpa memuat model)
+    
+    Di-cache: file model tidak berubah selama proses berjalan, jadi rerun
+    tidak perlu cek filesystem lagi.
+    """
+    if os.path.exists(MODEL_PATH_TFLITE):
+        return 'TFLite (INT8)'
+    elif os.path.exists(MODEL_PATH_TFLITE_FP16):
+        return 'TFLite (FP16)'
+    elif os.path.exists(MODEL_PATH_H5):
+        return 'H5'
+    elif os.path.exists(MODEL_PATH_KERAS):
+        return 'Keras'
+    return None
+
+MODEL_PATHS = {
+    'TFLite (INT8)': MODEL_PATH_TFLITE,
+    'TFLite (FP16)': MODEL_PATH_TFLITE_FP16,
+    'H5': MODEL_PATH_H5,
+    'Keras': MODEL_PATH_KERAS,
+}
+
+def read_model(model_format):
+    """Baca file model sesuai format dari detect_model_format (tanpa output UI)"""
+    path = MODEL_PATHS[model_format]
+    if model_format.startswith('TFLite'):
+        return TFLiteModel(path)
+    
+    # TensorFlow di-import di sini (bukan di atas file) karena import-nya
+    # makan beberapa detik; setelah import pertama modul sudah di sys.modules
+    import tensorflow as tf
+    return tf.keras.models.load_model(path, compile=False)
+
+class ModelLoader:
+    """Load + warmup model sekali per proses di background thread
+    
+    Thread dimulai saat halaman Klasifikasi dibuka, jadi model dimuat &
+    graph di-build selama user memilih file, bukan setelah upload.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self.model = None
+        self.forward = None
+        self.error = None
+    
+    def start(self, model_format):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._load, args=(model_format,), daemon=True
+                )
+                self._thread.start()
+    
+    def _load(self, model_format):
+        try:
+            # Konfigurasi GPU (memory growth) harus sebelum model dimuat
+            device = configure_inference_device()
+            model = read_model(model_format)
+            forward = make_forward_fn(model, device)
+            # Inferensi dummy sekali agar request pertama tidak kena biaya build graph
+            forward(np.zeros((1, IMG_SIZE, IMG_SIZE, 3), dtype=np.float32))
+            self.model, self.forward = model, forward
+        except Exception as e:
+            self.error = e
+    
+    def get(self, model_format):
+        """Tunggu sampai model siap; error saat loading dilempar ulang di sini"""
+        self.start(model_format)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.model
+
+@st.cache_resource
+def get_model_loader():
+    """Satu ModelLoader untuk semua session"""
+    return ModelLoader()
+
 @st.cache_resource
 def load_model():
-    """Load trained model - support both .h5 and .keras format"""
+    """Load trained model - support .tflite, .h5 and .keras format"""
     try:
-        # Coba load .h5 dulu
-        if os.path.exists(MODEL_PATH_H5):
-            st.info(f"📦 Loading model from {MODEL_PATH_H5}...")
-            model = tf.keras.models.load_model(MODEL_PATH_H5, compile=False)
-            st.success(f"✅ Model loaded successfully from .h5 file")
-            return model
+        model_format = detect_model_format()
         
-        # Kalau tidak ada, coba .keras
-        elif os.path.exists(MODEL_PATH_KERAS):
-            st.info(f"📦 Loading model from {MODEL_PATH_KERAS}...")
-            model = tf.keras.models.load_model(MODEL_PATH_KERAS, compile=False)
-            st.success(f"✅ Model loaded successfully from .keras file")
+        # Urutan prioritas format ada di detect_model_format
+        if model_format is not None:
+            model_path = MODEL_PATHS[model_format]
+            st.info(f"📦 Loading model from {model_path}...")
+            model = get_model_loader().get(model_format)
+            st.success(f"✅ Model loaded successfully from {model_path} ({model_format})")
             return model
         
         else:
             st.error("❌ Model file not found!")
-            st.error(f"Expected files: {MODEL_PATH_H5} or {MODEL_PATH_KERAS}")
+            st.error(f"Expected files: {MODEL_PATH_TFLITE}, {MODEL_PATH_TFLITE_FP16}, {MODEL_PATH_H5} or {MODEL_PATH_KERAS}")
             st.info("**LANGKAH DEPLOYMENT:**")
             st.info("1. Pastikan file berikut ada di folder yang sama dengan script ini:")
             st.code(f"   - {MODEL_PATH_H5} (atau {MODEL_PATH_KERAS})\n   - {CLASS_INDICES_PATH}\n   - 03_website_streamlit.py")
@@ -171,110 +543,201 @@ def load_model():
         
         return None
 
-@st.cache_data
+@st.cache_resource
 def load_class_indices():
-    """Load class mapping"""
+    """Load class mapping (read-only, dipakai bersama tanpa deep-copy)"""
     try:
-        if os.path.exists(CLASS_INDICES_PATH):
-            with open(CLASS_INDICES_PATH, 'r') as f:
-                class_mapping = json.load(f)
-            return class_mapping
-        else:
-            st.warning(f"⚠️ {CLASS_INDICES_PATH} not found. Using default mapping.")
-            # Default mapping jika file tidak ada
-            return {
-                'tari_bedhaya': 'Tari Bedhaya',
-                'tari_dolalak': 'Tari Dolalak',
-                'tari_gambyong': 'Tari Gambyong',
-                'tari_golek': 'Tari Golek',
-                'tari_srimpi': 'Tari Srimpi'
-            }
-    except Exception as e:
+        with open(CLASS_INDICES_PATH, 'rb') as f:
+            data = f.read()
+        class_mapping = orjson.loads(data) if orjson is not None else json.loads(data)
+    except FileNotFoundError:
+        st.warning(f"⚠️ {CLASS_INDICES_PATH} not found. Using default mapping.")
+        class_mapping = DEFAULT_CLASS_MAPPING
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError turunan class ini
         st.error(f"Error loading class indices: {e}")
-        return {
-            'tari_bedhaya': 'Tari Bedhaya',
-            'tari_dolalak': 'Tari Dolalak',
-            'tari_gambyong': 'Tari Gambyong',
-            'tari_golek': 'Tari Golek',
-            'tari_srimpi': 'Tari Srimpi'
-        }
+        class_mapping = DEFAULT_CLASS_MAPPING
+    
+    return types.MappingProxyType(class_mapping)
+
+@st.cache_resource
+def load_class_names():
+    """Nama kelas urut sesuai index output model (urutan values = urutan index)"""
+    return tuple(load_class_indices().values())
 
 def preprocess_image(image):
-    """Preprocessing gambar untuk prediksi"""
-    try:
-        # Resize ke ukuran yang dibutuhkan model
-        img = image.resize((IMG_SIZE, IMG_SIZE))
-        
-        # Convert ke array
-        img_array = np.array(img)
-        
-        # Pastikan RGB (bukan RGBA)
-        if len(img_array.shape) == 2:  # Grayscale
-            img_array = np.stack([img_array] * 3, axis=-1)
-        elif img_array.shape[-1] == 4:  # RGBA
-            img_array = img_array[:, :, :3]
-        
-        # Normalisasi (0-1)
-        img_array = img_array.astype(np.float32) / 255.0
-        
-        # Tambah batch dimension
-        img_array = np.expand_dims(img_array, axis=0)
-        
-        return img_array
-        
-    except Exception as e:
-        st.error(f"Error preprocessing image: {e}")
-        return None
+    """Preprocessing gambar untuk prediksi
+    
+    Error tidak ditangkap di sini: hasilnya di-cache (decode_and_preprocess),
+    jadi kegagalan harus berupa exception agar tidak ikut tersimpan.
+    """
+    # Convert ke RGB (grayscale/RGBA ditangani PIL)
+    img = image.convert('RGB')
+    
+    if cv2 is not None:
+        # tobytes() menyalin pixel resolusi penuh sekali (PIL tidak punya
+        # buffer yang bisa di-view numpy), lalu resize oleh OpenCV
+        src = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(img.height, img.width, 3)
+        interpolation = cv2.INTER_AREA if min(img.size) >= IMG_SIZE else cv2.INTER_LINEAR
+        pixels = cv2.resize(src, (IMG_SIZE, IMG_SIZE), interpolation=interpolation)
+    else:
+        img = img.resize((IMG_SIZE, IMG_SIZE), _RESAMPLE)
+        # tobytes() menyalin pixel 224x224 (kecil), frombuffer tanpa copy lagi
+        pixels = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(IMG_SIZE, IMG_SIZE, 3)
+    
+    # Normalisasi (0-1) via lookup table, ditulis langsung ke buffer
+    # float32 yang sudah punya batch dimension. mode='clip' agar numpy
+    # tidak mem-buffer `out` (index uint8 selalu valid)
+    img_array = np.empty((1, IMG_SIZE, IMG_SIZE, 3), dtype=np.float32)
+    np.take(_NORM_LUT, pixels, out=img_array[0], mode='clip')
+    
+    return img_array
 
-def predict_image(model, image, class_mapping):
-    """Prediksi kelas gambar"""
-    try:
-        # Preprocess
-        processed_img = preprocess_image(image)
-        
-        if processed_img is None:
-            return None, 0, []
-        
-        # Predict
-        predictions = model.predict(processed_img, verbose=0)
-        
-        # Get top prediction
-        predicted_class_idx = np.argmax(predictions[0])
-        confidence = predictions[0][predicted_class_idx] * 100
-        
-        # Map ke nama kelas
-        class_keys = list(class_mapping.keys())
-        predicted_class_key = class_keys[predicted_class_idx]
-        predicted_class_name = class_mapping[predicted_class_key]
-        
-        # Get all predictions dengan confidence
-        all_predictions = []
-        for idx, conf in enumerate(predictions[0]):
-            class_key = class_keys[idx]
-            class_name = class_mapping[class_key]
-            all_predictions.append({
-                'class': class_name,
-                'confidence': conf * 100
-            })
-        
-        # Sort berdasarkan confidence
-        all_predictions = sorted(all_predictions, key=lambda x: x['confidence'], reverse=True)
-        
-        return predicted_class_name, confidence, all_predictions
-        
-    except Exception as e:
-        st.error(f"Error during prediction: {e}")
-        with st.expander("🔧 See error details"):
-            st.exception(e)
-        return None, 0, []
+def open_image(file_bytes):
+    """Buka gambar dari bytes upload (decode masih lazy)"""
+    image = Image.open(io.BytesIO(file_bytes))
+    
+    # JPEG: decode langsung di skala 1/2, 1/4 atau 1/8 (DCT scaling)
+    # karena model hanya butuh 224x224 - foto HP 12 MP tidak perlu
+    # di-decode penuh
+    if image.format == 'JPEG':
+        image.draft('RGB', (IMG_SIZE * 2, IMG_SIZE * 2))
+    
+    return image
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def decode_and_preprocess(file_bytes):
+    """Decode + preprocess gambar upload, di-cache per isi file"""
+    return preprocess_image(open_image(file_bytes))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def load_display_image(file_bytes):
+    """Versi kecil (JPEG) dari gambar upload untuk ditampilkan di browser"""
+    display_img = open_image(file_bytes).convert('RGB')
+    display_img.thumbnail((DISPLAY_MAX_SIZE, DISPLAY_MAX_SIZE), Image.BILINEAR)
+    
+    buffer = io.BytesIO()
+    display_img.save(buffer, format='JPEG', quality=90)
+    return buffer.getvalue()
+
+def predict_image(processed_img, class_names):
+    """Prediksi kelas gambar (input: hasil preprocess_image)
+    
+    class_names: nama kelas urut sesuai index output model
+    """
+    # Predict - tensor identik (walau dari file berbeda) langsung dari cache
+    predictions = get_cached_infer()(processed_img.tobytes())
+    
+    # Confidence (%) semua kelas, urut dari yang tertinggi. Semua kelas
+    # ditampilkan, jadi perlu sort penuh (bukan argpartition top-k);
+    # [::-1] hanya view, tanpa array negasi sementara
+    probs = np.asarray(predictions, dtype=np.float32) * 100.0
+    order = np.argsort(probs)[::-1]
+    
+    # Map ke nama kelas
+    all_predictions = [
+        {'class': class_names[idx], 'confidence': float(probs[idx])}
+        for idx in order
+    ]
+    
+    # Top prediction = elemen pertama hasil sort
+    predicted_class_name = class_names[order[0]]
+    confidence = float(probs[order[0]])
+    
+    return predicted_class_name, confidence, all_predictions
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def predict_cached(file_bytes, class_names):
+    """Prediksi dengan cache berdasarkan isi file upload
+    
+    Streamlit menjalankan ulang script setiap ada interaksi widget, jadi
+    gambar yang sama tidak perlu di-decode maupun melewati model lagi.
+    Key cache = hash isi file_bytes (dihitung Streamlit); model hanya satu
+    per proses (ModelLoader), jadi tidak perlu ikut key. Exception (mis. TimeoutError
+    saat server sibuk) tidak di-cache, jadi upload yang sama dicoba lagi.
+    """
+    return predict_image(decode_and_preprocess(file_bytes), class_names)
+
+@st.cache_resource
+def placeholder_data_url(text, width, height):
+    """Placeholder SVG sebagai data URL base64 (dibuat sekali per proses)"""
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">'
+        f'<rect width="100%" height="100%" fill="#cccccc"/>'
+        f'<text x="50%" y="50%" dominant-baseline="middle" text-anchor="middle" '
+        f'font-family="sans-serif" font-size="{max(12, width // 14)}" fill="#969696">'
+        f'{html.escape(text)}</text>'
+        f'</svg>'
+    )
+    return 'data:image/svg+xml;base64,' + base64.b64encode(svg.encode('utf-8')).decode('ascii')
+
+# Placeholder statis (hasil placeholder_data_url, disimpan sebagai literal
+# supaya tidak dibangun ulang setiap rerun)
+_PLACEHOLDER_HOME = (
+    'data:image/svg+xml;base64,'
+    'PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSI0MDAi'
+    'IGhlaWdodD0iNTAwIiB2aWV3Qm94PSIwIDAgNDAwIDUwMCI+PHJlY3Qgd2lkdGg9IjEw'
+    'MCUiIGhlaWdodD0iMTAwJSIgZmlsbD0iI2NjY2NjYyIvPjx0ZXh0IHg9IjUwJSIgeT0i'
+    'NTAlIiBkb21pbmFudC1iYXNlbGluZT0ibWlkZGxlIiB0ZXh0LWFuY2hvcj0ibWlkZGxl'
+    'IiBmb250LWZhbWlseT0ic2Fucy1zZXJpZiIgZm9udC1zaXplPSIyOCIgZmlsbD0iIzk2'
+    'OTY5NiI+VGFyaSBKYXdhIFRlbmdhaDwvdGV4dD48L3N2Zz4='
+)
+_PLACEHOLDER_GOOD_LIGHTING = (
+    'data:image/svg+xml;base64,'
+    'PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIyMDAi'
+    'IGhlaWdodD0iMjAwIiB2aWV3Qm94PSIwIDAgMjAwIDIwMCI+PHJlY3Qgd2lkdGg9IjEw'
+    'MCUiIGhlaWdodD0iMTAwJSIgZmlsbD0iI2NjY2NjYyIvPjx0ZXh0IHg9IjUwJSIgeT0i'
+    'NTAlIiBkb21pbmFudC1iYXNlbGluZT0ibWlkZGxlIiB0ZXh0LWFuY2hvcj0ibWlkZGxl'
+    'IiBmb250LWZhbWlseT0ic2Fucy1zZXJpZiIgZm9udC1zaXplPSIxNCIgZmlsbD0iIzk2'
+    'OTY5NiI+R29vZCBMaWdodGluZzwvdGV4dD48L3N2Zz4='
+)
+_PLACEHOLDER_CLEAR_COSTUME = (
+    'data:image/svg+xml;base64,'
+    'PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIyMDAi'
+    'IGhlaWdodD0iMjAwIiB2aWV3Qm94PSIwIDAgMjAwIDIwMCI+PHJlY3Qgd2lkdGg9IjEw'
+    'MCUiIGhlaWdodD0iMTAwJSIgZmlsbD0iI2NjY2NjYyIvPjx0ZXh0IHg9IjUwJSIgeT0i'
+    'NTAlIiBkb21pbmFudC1iYXNlbGluZT0ibWlkZGxlIiB0ZXh0LWFuY2hvcj0ibWlkZGxl'
+    'IiBmb250LWZhbWlseT0ic2Fucy1zZXJpZiIgZm9udC1zaXplPSIxNCIgZmlsbD0iIzk2'
+    'OTY5NiI+Q2xlYXIgQ29zdHVtZTwvdGV4dD48L3N2Zz4='
+)
+_PLACEHOLDER_FOCUSED = (
+    'data:image/svg+xml;base64,'
+    'PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIyMDAi'
+    'IGhlaWdodD0iMjAwIiB2aWV3Qm94PSIwIDAgMjAwIDIwMCI+PHJlY3Qgd2lkdGg9IjEw'
+    'MCUiIGhlaWdodD0iMTAwJSIgZmlsbD0iI2NjY2NjYyIvPjx0ZXh0IHg9IjUwJSIgeT0i'
+    'NTAlIiBkb21pbmFudC1iYXNlbGluZT0ibWlkZGxlIiB0ZXh0LWFuY2hvcj0ibWlkZGxl'
+    'IiBmb250LWZhbWlseT0ic2Fucy1zZXJpZiIgZm9udC1zaXplPSIxNCIgZmlsbD0iIzk2'
+    'OTY5NiI+Rm9jdXNlZDwvdGV4dD48L3N2Zz4='
+)
+
+def show_placeholder(data_url, caption=None):
+    """Tampilkan placeholder (data URL) selebar kolom"""
+    caption_html = ''
+    if caption:
+        caption_html = (
+            f"<div style='text-align: center; font-size: 0.875rem; color: gray;'>"
+            f"{html.escape(caption)}</div>"
+        )
+    st.markdown(
+        f"<img src='{data_url}' style='width: 100%;'>"
+        f"{caption_html}",
+        unsafe_allow_html=True
+    )
+
+def show_tari_image(tari_name, image_path, caption=None):
+    """Gambar ilustrasi tarian dari disk, atau placeholder kalau belum ada"""
+    if os.path.exists(image_path):
+        st.image(image_path, use_container_width=True, caption=caption)
+    else:
+        show_placeholder(placeholder_data_url(tari_name, 400, 300), caption=caption)
 
 # ============================================================================
 # CUSTOM CSS
 # ============================================================================
 
-def load_css():
-    """Custom CSS untuk styling"""
-    st.markdown("""
+# Blok HTML/CSS statis disimpan sebagai konstanta level modul
+
+_CSS = """
     <style>
     /* Main container */
     .main {
@@ -332,11 +795,6 @@ def load_css():
         font-weight: bold;
     }
     
-    /* Progress bar custom */
-    .stProgress > div > div > div {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    }
-    
     /* Button styling */
     .stButton>button {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -363,7 +821,53 @@ def load_css():
         font-weight: 600;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+_HEADER_HTML = """
+    <div class="header-container">
+        <div class="header-title">🎭 Klasifikasi Kostum Tari Tradisional</div>
+        <div class="header-subtitle">Jawa Tengah - Powered by AI</div>
+    </div>
+    """
+
+_FEATURE_CARD_TEMPLATE = """
+        <div class="info-card">
+            <h4>{title}</h4>
+            <p>{text}</p>
+        </div>
+        """
+
+_RESULT_TEMPLATE = """
+                <div class="result-container">
+                    <div class="result-title">{name}</div>
+                    <div class="confidence-score">{conf:.2f}%</div>
+                    <div>Confidence Score</div>
+                </div>
+                """
+
+_SIDEBAR_FOOTER_HTML = """
+    <div style='text-align: center; font-size: 0.8rem; color: gray;'>
+    © 2025 Fasya Maulinada<br>
+    Universitas Muria Kudus
+    </div>
+    """
+
+@st.cache_resource
+def minify_css(css):
+    """Buang komentar & whitespace dari CSS (payload lebih kecil setiap rerun)"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+def load_css():
+    """Custom CSS untuk styling
+    
+    Tetap dikirim setiap rerun: Streamlit menghapus elemen yang tidak
+    di-render ulang, jadi CSS yang hanya dikirim sekali per session akan
+    hilang setelah interaksi pertama. Yang dikirim versi minified.
+    """
+    st.markdown(minify_css(_CSS), unsafe_allow_html=True)
 
 # ============================================================================
 # PAGE FUNCTIONS
@@ -372,12 +876,7 @@ def load_css():
 def home_page():
     """Halaman utama"""
     # Header
-    st.markdown("""
-    <div class="header-container">
-        <div class="header-title">🎭 Klasifikasi Kostum Tari Tradisional</div>
-        <div class="header-subtitle">Jawa Tengah - Powered by AI</div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Intro
     col1, col2 = st.columns([2, 1])
@@ -401,8 +900,7 @@ def home_page():
         """)
     
     with col2:
-        st.image("https://via.placeholder.com/400x500?text=Tari+Jawa+Tengah", 
-                use_container_width=True)
+        show_placeholder(_PLACEHOLDER_HOME)
     
     # Features
     st.markdown("---")
@@ -411,36 +909,33 @@ def home_page():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
-        <div class="info-card">
-            <h4>🎯 Akurasi Tinggi</h4>
-            <p>Model dilatih dengan >1500 gambar</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_FEATURE_CARD_TEMPLATE.format(
+            title="🎯 Akurasi Tinggi", text="Model dilatih dengan >1500 gambar"
+        ), unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div class="info-card">
-            <h4>⚡ Cepat & Efisien</h4>
-            <p>Prediksi instan dalam hitungan detik</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_FEATURE_CARD_TEMPLATE.format(
+            title="⚡ Cepat & Efisien", text="Prediksi instan dalam hitungan detik"
+        ), unsafe_allow_html=True)
     
     with col3:
-        st.markdown("""
-        <div class="info-card">
-            <h4>📚 Edukatif</h4>
-            <p>Dilengkapi informasi lengkap setiap tarian</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_FEATURE_CARD_TEMPLATE.format(
+            title="📚 Edukatif", text="Dilengkapi informasi lengkap setiap tarian"
+        ), unsafe_allow_html=True)
 
-def classification_page(model, class_mapping):
+def classification_page(class_names):
     """Halaman klasifikasi"""
     st.title("🎯 Klasifikasi Kostum Tari")
     
-    if model is None:
+    # Load model (import TensorFlow + load + warmup) dimulai di background
+    # saat halaman ini dibuka, jadi berjalan selama user memilih file.
+    # Halaman lain tidak memuat TensorFlow sama sekali
+    model_format = detect_model_format()
+    if model_format is None:
+        load_model()  # Tampilkan petunjuk deployment
         st.error("❌ Model tidak dapat dimuat. Silakan hubungi administrator.")
         st.stop()
+    get_model_loader().start(model_format)
     
     st.markdown("Upload gambar kostum tari untuk mendapatkan prediksi jenis tariannya.")
     
@@ -452,37 +947,47 @@ def classification_page(model, class_mapping):
     )
     
     if uploaded_file is not None:
+        # Tunggu model siap (biasanya sudah selesai di background)
+        if load_model() is None:
+            st.error("❌ Model tidak dapat dimuat. Silakan hubungi administrator.")
+            st.stop()
+        
         try:
-            # Display uploaded image
-            image = Image.open(uploaded_file)
+            # Decode sekali per file, rerun berikutnya diambil dari cache
+            file_bytes = uploaded_file.getvalue()
+            display_bytes = load_display_image(file_bytes)
             
             col1, col2 = st.columns([1, 1])
             
             with col1:
                 st.markdown("#### 📸 Gambar yang Diupload")
-                st.image(image, use_container_width=True)
+                st.image(display_bytes, use_container_width=True)
             
             with col2:
                 st.markdown("#### 🤖 Hasil Klasifikasi")
                 
-                with st.spinner('Menganalisis gambar...'):
-                    # Predict
-                    predicted_class, confidence, all_predictions = predict_image(
-                        model, image, class_mapping
-                    )
-                
-                if predicted_class is None:
-                    st.error("❌ Error saat melakukan prediksi")
-                    st.stop()
+                # Hasil terakhir disimpan per session: rerun karena widget lain
+                # (file sama) langsung pakai hasil ini tanpa lookup cache.
+                # Hanya prediksi yang berhasil disimpan, error dicoba lagi
+                pred_key = hash(file_bytes)
+                if st.session_state.get('last_pred_key') != pred_key:
+                    try:
+                        with st.spinner('Menganalisis gambar...'):
+                            # Predict
+                            last_pred = predict_cached(file_bytes, class_names)
+                    except Exception as e:
+                        st.error(f"❌ Error saat melakukan prediksi: {e}")
+                        with st.expander("🔧 See error details"):
+                            st.exception(e)
+                        st.stop()
+                    st.session_state['last_pred'] = last_pred
+                    st.session_state['last_pred_key'] = pred_key
+                predicted_class, confidence, all_predictions = st.session_state['last_pred']
                 
                 # Display result
-                st.markdown(f"""
-                <div class="result-container">
-                    <div class="result-title">{predicted_class}</div>
-                    <div class="confidence-score">{confidence:.2f}%</div>
-                    <div>Confidence Score</div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_RESULT_TEMPLATE.format(
+                    name=predicted_class, conf=confidence
+                ), unsafe_allow_html=True)
                 
                 # Confidence interpretation
                 if confidence >= 90:
@@ -496,21 +1001,27 @@ def classification_page(model, class_mapping):
             st.markdown("---")
             st.markdown("#### 📊 Semua Prediksi")
             
-            for pred in all_predictions:
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.progress(pred['confidence'] / 100)
-                with col2:
-                    st.markdown(f"**{pred['confidence']:.1f}%**")
-                st.markdown(f"**{pred['class']}**")
-                st.markdown("")
+            # Satu tabel dengan progress bar (bukan widget per kelas),
+            # urutan tetap dari confidence tertinggi
+            st.dataframe(
+                pd.DataFrame(all_predictions),
+                column_config={
+                    'class': st.column_config.TextColumn('Tari'),
+                    'confidence': st.column_config.ProgressColumn(
+                        'Confidence', format='%.1f%%', min_value=0, max_value=100
+                    ),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
             
             # Info tarian yang diprediksi
-            if predicted_class in TARI_INFO:
+            tari_info = get_tari_info()
+            if predicted_class in tari_info:
                 st.markdown("---")
                 st.markdown(f"### 📖 Tentang {predicted_class}")
                 
-                info = TARI_INFO[predicted_class]
+                info = tari_info[predicted_class]
                 
                 col1, col2 = st.columns([2, 1])
                 
@@ -525,7 +1036,7 @@ def classification_page(model, class_mapping):
                     st.markdown(f"**Asal:** {info['asal']}")
                 
                 with col2:
-                    st.image(info['image'], use_container_width=True)
+                    show_tari_image(predicted_class, info['image'])
                     
         except Exception as e:
             st.error(f"Error processing image: {e}")
@@ -541,18 +1052,15 @@ def classification_page(model, class_mapping):
         col1, col2, col3 = st.columns(3)
         with col1:
             st.markdown("✅ **Pencahayaan Baik**")
-            st.image("https://via.placeholder.com/200x200?text=Good+Lighting", 
-                    use_container_width=True)
+            show_placeholder(_PLACEHOLDER_GOOD_LIGHTING)
         
         with col2:
             st.markdown("✅ **Kostum Jelas Terlihat**")
-            st.image("https://via.placeholder.com/200x200?text=Clear+Costume", 
-                    use_container_width=True)
+            show_placeholder(_PLACEHOLDER_CLEAR_COSTUME)
         
         with col3:
             st.markdown("✅ **Fokus pada Penari**")
-            st.image("https://via.placeholder.com/200x200?text=Focused", 
-                    use_container_width=True)
+            show_placeholder(_PLACEHOLDER_FOCUSED)
 
 def catalog_page():
     """Halaman katalog tarian"""
@@ -560,9 +1068,10 @@ def catalog_page():
     st.markdown("Pelajari lebih dalam tentang 5 tarian tradisional yang dapat diklasifikasi sistem ini.")
     
     # Tabs untuk setiap tarian
-    tabs = st.tabs([name for name in TARI_INFO.keys()])
+    tari_info = get_tari_info()
+    tabs = st.tabs([name for name in tari_info.keys()])
     
-    for idx, (tari_name, info) in enumerate(TARI_INFO.items()):
+    for idx, (tari_name, info) in enumerate(tari_info.items()):
         with tabs[idx]:
             col1, col2 = st.columns([2, 1])
             
@@ -580,8 +1089,7 @@ def catalog_page():
                 st.markdown(info['asal'])
             
             with col2:
-                st.image(info['image'], use_container_width=True, 
-                        caption=f"Ilustrasi {tari_name}")
+                show_tari_image(tari_name, info['image'], caption=f"Ilustrasi {tari_name}")
                 
                 # Fun fact atau info tambahan
                 with st.expander("ℹ️ Tahukah Anda?"):
@@ -656,9 +1164,10 @@ def main():
     # Load CSS
     load_css()
     
-    # Load model
-    model = load_model()
+    # Model baru dimuat di halaman Klasifikasi (import TensorFlow + load
+    # model makan beberapa detik), halaman lain tidak perlu menunggu
     class_mapping = load_class_indices()
+    class_names = load_class_names()
     
     # Sidebar
     st.sidebar.title("🎭 Navigation")
@@ -674,28 +1183,24 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📊 Informasi Sistem")
     
-    if model is not None:
-        st.sidebar.success("✅ Model: Loaded")
+    model_format = detect_model_format()
+    if model_format is not None:
+        st.sidebar.success("✅ Model: Available")
         st.sidebar.info(f"📦 Classes: {len(class_mapping)}")
-        st.sidebar.info(f"📁 Format: {'H5' if os.path.exists(MODEL_PATH_H5) else 'Keras'}")
+        st.sidebar.info(f"📁 Format: {model_format}")
     else:
-        st.sidebar.error("❌ Model: Not Loaded")
+        st.sidebar.error("❌ Model: Not Found")
         st.sidebar.warning("Pastikan file model tersedia")
     
     st.sidebar.markdown("---")
-    st.sidebar.markdown("""
-    <div style='text-align: center; font-size: 0.8rem; color: gray;'>
-    © 2025 Fasya Maulinada<br>
-    Universitas Muria Kudus
-    </div>
-    """, unsafe_allow_html=True)
+    st.sidebar.markdown(_SIDEBAR_FOOTER_HTML, unsafe_allow_html=True)
     
     # Route to pages
     if menu == "🏠 Beranda":
         home_page()
     
     elif menu == "🎯 Klasifikasi":
-        classification_page(model, class_mapping)
+        classification_page(class_names)
     
     elif menu == "📚 Katalog":
         catalog_page()
@@ -0,0 +1,222 @@
+"""
+KONVERSI MODEL KE TFLITE (INT8 / FP16)
+======================================
+Konversi model Keras (.h5 / .keras) menjadi TFLite dengan post-training
+quantization, untuk dipakai oleh 03_website_streamlit.py
+
+Cara pakai:
+    python 04_convert_tflite.py --dataset dataset/train   # INT8
+    python 04_convert_tflite.py --fp16                    # FP16
+
+Mode INT8: folder dataset berisi subfolder per kelas (struktur yang sama
+dengan saat training). Sekitar 100 gambar diambil untuk kalibrasi.
+Mode FP16: bobot disimpan sebagai float16 (ukuran file ~1/2), tidak
+perlu dataset kalibrasi. Mode INT8 otomatis fallback ke FP16 kalau
+agreement dengan model Keras di bawah MIN_AGREEMENT.
+
+Catatan INT8: post-training quantization per-tensor pada depthwise conv
+MobileNetV2 bisa menurunkan akurasi cukup besar. Setelah konversi, script
+ini membandingkan prediksi top-1 model INT8 dengan model Keras. Kalau
+agreement rendah, solusinya ada di tahap training (di luar repo ini):
+bangun ulang MobileNetV2 dengan blok yang quantization-friendly (tanpa
+BN+ReLU6 di antara depthwise dan pointwise, ReLU6 -> ReLU pada pointwise),
+fine-tune ulang, lalu jalankan konversi ini lagi.
+"""
+
+# ============================================================================
+# IMPORT
+# ============================================================================
+
+import argparse
+import os
+import random
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+from PIL import Image
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# ============================================================================
+# KONFIGURASI
+# ============================================================================
+
+MODEL_PATH_H5 = 'final_model.h5'
+MODEL_PATH_KERAS = 'final_model.keras'
+OUTPUT_PATH_INT8 = 'final_model_int8.tflite'
+OUTPUT_PATH_FP16 = 'final_model_fp16.tflite'
+
+# Harus sama dengan website & training
+IMG_SIZE = 224
+
+# Metode resize - harus sama dengan _RESAMPLE / pilihan INTER_AREA-INTER_LINEAR
+# di website (lihat komentar _RESAMPLE di sana)
+RESAMPLE = Image.Resampling.BILINEAR
+
+# Jumlah gambar untuk kalibrasi representative dataset
+NUM_CALIBRATION_IMAGES = 100
+
+# Jumlah gambar (di luar set kalibrasi) untuk cek agreement INT8 vs Keras
+NUM_EVAL_IMAGES = 100
+
+# Batas minimum agreement top-1 INT8 vs Keras. Di bawah batas ini output
+# otomatis diganti FP16 (ke OUTPUT_PATH_FP16)
+MIN_AGREEMENT = 0.95
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+# ============================================================================
+# UTILITIES
+# ============================================================================
+
+def load_keras_model():
+    """Load model Keras - .h5 dulu, kalau tidak ada .keras"""
+    for path in (MODEL_PATH_H5, MODEL_PATH_KERAS):
+        if os.path.exists(path):
+            print(f"📦 Loading model from {path}...")
+            return tf.keras.models.load_model(path, compile=False)
+    raise FileNotFoundError(f"Model tidak ditemukan: {MODEL_PATH_H5} atau {MODEL_PATH_KERAS}")
+
+def preprocess_image(path):
+    """Preprocessing gambar - sama persis dengan open_image + preprocess_image di website"""
+    img = Image.open(path)
+    # JPEG di-decode di skala kecil (DCT scaling) seperti di website, supaya
+    # kalibrasi & cek agreement memakai tensor yang sama dengan produksi
+    if img.format == 'JPEG':
+        img.draft('RGB', (IMG_SIZE * 2, IMG_SIZE * 2))
+    img = img.convert('RGB')
+    if cv2 is not None:
+        interpolation = cv2.INTER_AREA if min(img.size) >= IMG_SIZE else cv2.INTER_LINEAR
+        pixels = cv2.resize(np.asarray(img, dtype=np.uint8), (IMG_SIZE, IMG_SIZE),
+                            interpolation=interpolation)
+    else:
+        pixels = np.asarray(img.resize((IMG_SIZE, IMG_SIZE), RESAMPLE), dtype=np.uint8)
+
+    # Normalisasi langsung ke buffer float32 dengan batch dimension
+    # (nilainya identik dengan lookup table di website: i / 255 dalam float32)
+    img_array = np.empty((1, IMG_SIZE, IMG_SIZE, 3), dtype=np.float32)
+    np.divide(pixels, np.float32(255.0), out=img_array[0], dtype=np.float32)
+    return img_array
+
+def collect_images(dataset_dir):
+    """Ambil gambar dari folder dataset dalam urutan acak (seed tetap)"""
+    paths = [
+        p for p in Path(dataset_dir).rglob('*')
+        if p.suffix.lower() in IMAGE_EXTENSIONS
+    ]
+    if not paths:
+        raise FileNotFoundError(f"Tidak ada gambar di folder {dataset_dir}")
+
+    random.seed(42)
+    random.shuffle(paths)
+    return paths
+
+# ============================================================================
+# KONVERSI
+# ============================================================================
+
+def convert_int8(model, calibration_paths):
+    """Full-integer quantization (input/output uint8)"""
+    def representative_dataset():
+        for path in calibration_paths:
+            yield [preprocess_image(path)]
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.uint8
+    converter.inference_output_type = tf.uint8
+    return converter.convert()
+
+def evaluate_agreement(model, tflite_model, eval_paths):
+    """Persentase gambar dengan prediksi top-1 sama antara Keras dan TFLite"""
+    interpreter = tf.lite.Interpreter(model_content=tflite_model)
+    interpreter.allocate_tensors()
+    input_detail = interpreter.get_input_details()[0]
+    output_detail = interpreter.get_output_details()[0]
+
+    matches = 0
+    for path in eval_paths:
+        img = preprocess_image(path)
+        expected = np.argmax(model(img, training=False)[0])
+
+        if input_detail['dtype'] != np.float32:
+            scale, zero_point = input_detail['quantization']
+            dtype_info = np.iinfo(input_detail['dtype'])
+            img = np.clip(np.round(img / scale + zero_point), dtype_info.min, dtype_info.max)
+            img = img.astype(input_detail['dtype'])
+
+        interpreter.set_tensor(input_detail['index'], img)
+        interpreter.invoke()
+        actual = np.argmax(interpreter.get_tensor(output_detail['index'])[0])
+        matches += int(actual == expected)
+
+    return matches / len(eval_paths)
+
+def convert_fp16(model):
+    """Float16 weight quantization (input/output tetap float32)"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_types = [tf.float16]
+    return converter.convert()
+
+def main():
+    parser = argparse.ArgumentParser(description="Konversi model ke TFLite INT8 / FP16")
+    parser.add_argument('--dataset', default='dataset/train',
+                        help="Folder gambar untuk kalibrasi INT8 (default: dataset/train)")
+    parser.add_argument('--fp16', action='store_true',
+                        help="Konversi ke FP16 (tanpa kalibrasi) alih-alih INT8")
+    parser.add_argument('--output', default=None,
+                        help=f"Path file output (default: {OUTPUT_PATH_INT8} / {OUTPUT_PATH_FP16})")
+    args = parser.parse_args()
+
+    model = load_keras_model()
+    if args.fp16:
+        output_path = args.output or OUTPUT_PATH_FP16
+        output_format = 'FP16'
+        tflite_model = convert_fp16(model)
+    else:
+        output_path = args.output or OUTPUT_PATH_INT8
+        output_format = 'INT8'
+        paths = collect_images(args.dataset)
+        calibration_paths = paths[:NUM_CALIBRATION_IMAGES]
+        # Set evaluasi terpisah dari kalibrasi; kalau dataset terlalu kecil
+        # pakai ulang gambar kalibrasi
+        eval_paths = paths[NUM_CALIBRATION_IMAGES:NUM_CALIBRATION_IMAGES + NUM_EVAL_IMAGES]
+        eval_paths = eval_paths or calibration_paths
+
+        print(f"🔧 Kalibrasi dengan {len(calibration_paths)} gambar...")
+        tflite_model = convert_int8(model, calibration_paths)
+
+        agreement = evaluate_agreement(model, tflite_model, eval_paths)
+        print(f"📊 Agreement top-1 INT8 vs Keras: {agreement:.1%} ({len(eval_paths)} gambar)")
+        if agreement < MIN_AGREEMENT:
+            # INT8 terlalu lossy: simpan FP16 saja (akurasi praktis sama dengan
+            # Keras, ukuran ~1/2). File INT8 tidak ditulis supaya website
+            # memakai model FP16. --output tidak dipakai: nama file itu
+            # dimaksudkan untuk INT8
+            print(f"⚠️ Agreement di bawah {MIN_AGREEMENT:.0%} - INT8 kehilangan akurasi.")
+            print("   Fallback ke FP16. Untuk INT8 yang akurat pakai arsitektur")
+            print("   quantization-friendly (lihat docstring)")
+            if args.output:
+                print(f"   --output {args.output} diabaikan untuk fallback FP16")
+            output_path = OUTPUT_PATH_FP16
+            output_format = 'FP16'
+            tflite_model = convert_fp16(model)
+            if os.path.exists(OUTPUT_PATH_INT8):
+                print(f"⚠️ {OUTPUT_PATH_INT8} lama masih ada dan akan dipakai website "
+                      f"lebih dulu - hapus file tersebut")
+
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+
+    size_mb = len(tflite_model) / (1024 * 1024)
+    print(f"✅ Model TFLite {output_format} disimpan ke {output_path} ({size_mb:.1f} MB)")
+
+if __name__ == "__main__":
+    main()